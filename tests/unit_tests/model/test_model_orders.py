@@ -53,25 +53,53 @@ from nautilus_trader.model.orders import StopMarketOrder
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs import UNIX_EPOCH
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 
+# Immutable values reused across tests (avoids re-parsing and re-generating per test)
+PRICE_0_99990 = Price.from_str("0.99990")
+PRICE_1_00000 = Price.from_str("1.00000")
+PRICE_1_00001 = Price.from_str("1.00001")
+PRICE_1_00010 = Price.from_str("1.00010")
+PRICE_1_10010 = Price.from_str("1.10010")
+DECIMAL_0_00050 = Decimal("0.00050")
+DECIMAL_5 = Decimal("5")
+DECIMAL_10 = Decimal("10")
+TEST_UUID = UUID4("2d89666b-1a1e-4a75-b193-4eb3b454c757")
+CLIENT_ORDER_ID = ClientOrderId("O-123456")
+VENUE_ORDER_ID = VenueOrderId("1")
+POSITION_ID = PositionId("P-123456")
+
 
 class TestOrders:
-    def setup(self):
-        # Fixture Setup
-        self.trader_id = TestIdStubs.trader_id()
-        self.strategy_id = TestIdStubs.strategy_id()
-        self.account_id = TestIdStubs.account_id()
-
-        self.order_factory = OrderFactory(
-            trader_id=self.trader_id,
-            strategy_id=self.strategy_id,
+    @classmethod
+    def setup_class(cls):
+        # Fixture Setup (shared across tests, the factory is reset per test)
+        cls.trader_id = TestIdStubs.trader_id()
+        cls.strategy_id = TestIdStubs.strategy_id()
+        cls.account_id = TestIdStubs.account_id()
+
+        cls.order_factory = OrderFactory(
+            trader_id=cls.trader_id,
+            strategy_id=cls.strategy_id,
             clock=TestClock(),
         )
 
+    def setup(self):
+        # Reset ID generators so every test sees deterministic client order IDs
+        self.order_factory.reset()
+
+    @pytest.fixture(name="market_order")
+    def fixture_market_order(self):
+        return self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
     def test_opposite_side_given_invalid_value_raises_value_error(self):
         # Arrange, Act, Assert
         with pytest.raises(ValueError):
@@ -140,10 +168,10 @@ class TestOrders:
             self.trader_id,
             self.strategy_id,
             AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
+            CLIENT_ORDER_ID,
             order_side,
             Quantity.from_int(1),
-            UUID4(),
+            TEST_UUID,
             0,
         )
 
@@ -160,10 +188,10 @@ class TestOrders:
                 self.trader_id,
                 self.strategy_id,
                 AUDUSD_SIM.id,
-                ClientOrderId("O-123456"),
+                CLIENT_ORDER_ID,
                 OrderSide.BUY,
                 Quantity.zero(),  # <- invalid
-                UUID4(),
+                TEST_UUID,
                 0,
             )
 
@@ -174,10 +202,10 @@ class TestOrders:
                 self.trader_id,
                 self.strategy_id,
                 AUDUSD_SIM.id,
-                ClientOrderId("O-123456"),
+                CLIENT_ORDER_ID,
                 OrderSide.BUY,
                 Quantity.from_int(100_000),
-                UUID4(),
+                TEST_UUID,
                 0,
                 TimeInForce.GTD,  # <-- invalid
             )
@@ -189,11 +217,11 @@ class TestOrders:
                 self.trader_id,
                 self.strategy_id,
                 AUDUSD_SIM.id,
-                ClientOrderId("O-123456"),
+                CLIENT_ORDER_ID,
                 OrderSide.BUY,
                 Quantity.from_int(100_000),
-                trigger_price=Price.from_str("1.00000"),
-                init_id=UUID4(),
+                trigger_price=PRICE_1_00000,
+                init_id=TEST_UUID,
                 ts_init=0,
                 time_in_force=TimeInForce.GTD,
                 expire_time=None,
@@ -206,12 +234,12 @@ class TestOrders:
                 self.trader_id,
                 self.strategy_id,
                 AUDUSD_SIM.id,
-                ClientOrderId("O-123456"),
+                CLIENT_ORDER_ID,
                 OrderSide.BUY,
                 Quantity.from_int(100_000),
-                price=Price.from_str("1.00001"),
-                trigger_price=Price.from_str("1.00000"),
-                init_id=UUID4(),
+                price=PRICE_1_00001,
+                trigger_price=PRICE_1_00000,
+                init_id=TEST_UUID,
                 ts_init=0,
                 time_in_force=TimeInForce.GTD,
                 expire_time=None,
@@ -224,10 +252,10 @@ class TestOrders:
                 self.trader_id,
                 self.strategy_id,
                 AUDUSD_SIM.id,
-                ClientOrderId("O-123456"),
+                CLIENT_ORDER_ID,
                 OrderSide.BUY,
                 Quantity.from_int(100_000),
-                UUID4(),
+                TEST_UUID,
                 0,
                 TimeInForce.AT_THE_CLOSE,  # <-- invalid
             )
@@ -238,11 +266,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
         over_fill = TestEventStubs.order_filled(
             order,
             instrument=AUDUSD_SIM,
@@ -259,7 +286,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
         # Act
@@ -269,7 +296,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
         assert order2.client_order_id.value == "O-19700101-0000-000-001-1"
@@ -285,16 +312,11 @@ class TestOrders:
         # Assert
         assert order.symbol == AUDUSD_SIM.id.symbol
         assert order.venue == AUDUSD_SIM.id.venue
-        assert order.order_type == OrderType.MARKET
-        assert order.status == OrderStatus.INITIALIZED
         assert order.side_string == "BUY"
         assert order.signed_decimal_qty() == Decimal(100_000)
-        assert order.event_count == 1
         assert isinstance(order.last_event, OrderInitialized)
         assert not order.has_price
         assert not order.has_trigger_price
-        assert not order.is_open
-        assert not order.is_closed
         assert not order.is_inflight
         assert order.is_buy
         assert order.is_aggressive
@@ -305,7 +327,6 @@ class TestOrders:
         assert not order.is_child_order
         assert order.ts_last == 0
         assert order.last_event.ts_init == 0
-        assert isinstance(order.init_event, OrderInitialized)
 
     def test_initialize_sell_market_order(self):
         # Arrange, Act
@@ -333,6 +354,58 @@ class TestOrders:
         assert order.ts_last == 0
         assert isinstance(order.init_event, OrderInitialized)
 
+    @pytest.mark.parametrize(
+        "factory_method, kwargs, expected_type",
+        [
+            ["market", {}, OrderType.MARKET],
+            ["limit", {"price": PRICE_1_00000}, OrderType.LIMIT],
+            ["stop_market", {"trigger_price": PRICE_1_00000}, OrderType.STOP_MARKET],
+            [
+                "stop_limit",
+                {"price": PRICE_1_00000, "trigger_price": PRICE_1_10010},
+                OrderType.STOP_LIMIT,
+            ],
+            ["market_to_limit", {}, OrderType.MARKET_TO_LIMIT],
+            ["market_if_touched", {"trigger_price": PRICE_1_00000}, OrderType.MARKET_IF_TOUCHED],
+            [
+                "limit_if_touched",
+                {"price": PRICE_1_00000, "trigger_price": PRICE_1_10010},
+                OrderType.LIMIT_IF_TOUCHED,
+            ],
+            [
+                "trailing_stop_market",
+                {"trailing_offset": DECIMAL_0_00050},
+                OrderType.TRAILING_STOP_MARKET,
+            ],
+            [
+                "trailing_stop_limit",
+                {"limit_offset": DECIMAL_5, "trailing_offset": DECIMAL_10},
+                OrderType.TRAILING_STOP_LIMIT,
+            ],
+        ],
+    )
+    def test_initialize_order_from_factory_returns_initialized_order(
+        self,
+        factory_method,
+        kwargs,
+        expected_type,
+    ):
+        # Arrange, Act
+        order = getattr(self.order_factory, factory_method)(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            **kwargs,
+        )
+
+        # Assert
+        assert order.order_type == expected_type
+        assert order.status == OrderStatus.INITIALIZED
+        assert order.event_count == 1
+        assert isinstance(order.init_event, OrderInitialized)
+        assert not order.is_open
+        assert not order.is_closed
+
     def test_order_equality(self):
         # Arrange, Act
         order = self.order_factory.market(
@@ -412,21 +485,16 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
         # Assert
-        assert order.order_type == OrderType.LIMIT
         assert order.expire_time is None
-        assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTC
         assert order.has_price
         assert not order.has_trigger_price
         assert order.is_passive
-        assert not order.is_open
         assert not order.is_aggressive
-        assert not order.is_closed
-        assert isinstance(order.init_event, OrderInitialized)
         assert (
             str(order)
             == "LimitOrder(BUY 100_000 AUD/USD.SIM LIMIT @ 1.00000 GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, tags=None)"  # noqa
@@ -442,7 +510,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
             display_qty=Quantity.from_int(20_000),
             exec_algorithm_id=ExecAlgorithmId("VWAP"),
             exec_algorithm_params={"period": 60},
@@ -494,7 +562,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
             TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
         )
@@ -502,7 +570,7 @@ class TestOrders:
         # Assert
         assert order.instrument_id == AUDUSD_SIM.id
         assert order.order_type == OrderType.LIMIT
-        assert order.price == Price.from_str("1.00000")
+        assert order.price == PRICE_1_00000
         assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTD
         assert order.expire_time == UNIX_EPOCH + timedelta(minutes=1)
@@ -523,21 +591,16 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
             TriggerType.BID_ASK,
         )
 
         # Assert
-        assert order.order_type == OrderType.STOP_MARKET
-        assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTC
         assert not order.has_price
         assert order.has_trigger_price
         assert order.is_passive
         assert not order.is_aggressive
-        assert not order.is_open
-        assert not order.is_closed
-        assert isinstance(order.init_event, OrderInitialized)
         assert (
             str(order)
             == "StopMarketOrder(BUY 100_000 AUD/USD.SIM STOP_MARKET @ 1.00000[BID_ASK] GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, tags=None)"  # noqa
@@ -553,7 +616,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
             emulation_trigger=TriggerType.BID_ASK,
         )
 
@@ -602,22 +665,18 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
-            Price.from_str("1.10010"),
+            PRICE_1_00000,
+            PRICE_1_10010,
             tags="ENTRY",
         )
 
         # Assert
-        assert order.order_type == OrderType.STOP_LIMIT
         assert order.expire_time is None
-        assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTC
         assert order.has_price
         assert order.has_trigger_price
         assert order.is_passive
         assert not order.is_aggressive
-        assert not order.is_closed
-        assert isinstance(order.init_event, OrderInitialized)
         assert (
             str(order)
             == "StopLimitOrder(BUY 100_000 AUD/USD.SIM STOP_LIMIT @ 1.10010-STOP[DEFAULT] 1.00000-LIMIT GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, tags=ENTRY)"  # noqa
@@ -633,8 +692,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
-            Price.from_str("1.10010"),
+            PRICE_1_00000,
+            PRICE_1_10010,
             trigger_type=TriggerType.MARK_PRICE,
             tags="STOP_LOSS",
         )
@@ -766,22 +825,17 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
             TriggerType.BID_ASK,
         )
 
         # Assert
-        assert order.order_type == OrderType.MARKET_IF_TOUCHED
-        assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTC
         assert order.expire_time is None
         assert not order.has_price
         assert order.has_trigger_price
         assert order.is_passive
         assert not order.is_aggressive
-        assert not order.is_open
-        assert not order.is_closed
-        assert isinstance(order.init_event, OrderInitialized)
         assert (
             str(order)
             == "MarketIfTouchedOrder(BUY 100_000 AUD/USD.SIM MARKET_IF_TOUCHED @ 1.00000[BID_ASK] GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, tags=None)"  # noqa
@@ -797,7 +851,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
         # Act
@@ -845,8 +899,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
-            Price.from_str("1.10010"),
+            PRICE_1_00000,
+            PRICE_1_10010,
             emulation_trigger=TriggerType.LAST_TRADE,
             tags="ENTRY",
         )
@@ -879,8 +933,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
-            Price.from_str("1.10010"),
+            PRICE_1_00000,
+            PRICE_1_10010,
             trigger_type=TriggerType.MARK_PRICE,
             emulation_trigger=TriggerType.LAST_TRADE,
             tags="STOP_LOSS",
@@ -934,8 +988,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            trigger_price=Price.from_str("1.00000"),
-            trailing_offset=Decimal("0.00050"),
+            trigger_price=PRICE_1_00000,
+            trailing_offset=DECIMAL_0_00050,
             emulation_trigger=TriggerType.BID_ASK,
         )
 
@@ -968,7 +1022,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            trailing_offset=Decimal("0.00050"),
+            trailing_offset=DECIMAL_0_00050,
         )
 
         # Assert
@@ -997,8 +1051,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            trigger_price=Price.from_str("1.00000"),
-            trailing_offset=Decimal("0.00050"),
+            trigger_price=PRICE_1_00000,
+            trailing_offset=DECIMAL_0_00050,
         )
 
         # Act
@@ -1048,7 +1102,7 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            trailing_offset=Decimal("0.00050"),
+            trailing_offset=DECIMAL_0_00050,
         )
 
         # Act
@@ -1098,22 +1152,18 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            price=Price.from_str("1.00000"),
-            trigger_price=Price.from_str("1.10010"),
-            limit_offset=Decimal("5"),
-            trailing_offset=Decimal("10"),
+            price=PRICE_1_00000,
+            trigger_price=PRICE_1_10010,
+            limit_offset=DECIMAL_5,
+            trailing_offset=DECIMAL_10,
         )
 
         # Assert
-        assert order.order_type == OrderType.TRAILING_STOP_LIMIT
-        assert order.status == OrderStatus.INITIALIZED
         assert order.time_in_force == TimeInForce.GTC
         assert order.has_price
         assert order.has_trigger_price
         assert order.is_passive
         assert not order.is_aggressive
-        assert not order.is_closed
-        assert isinstance(order.init_event, OrderInitialized)
         assert (
             str(order)
             == "TrailingStopLimitOrder(BUY 100_000 AUD/USD.SIM TRAILING_STOP_LIMIT[DEFAULT] @ 1.10010-STOP [DEFAULT] 1.00000-LIMIT 10-TRAILING_OFFSET[PRICE] 5-LIMIT_OFFSET[PRICE] GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, tags=None)"  # noqa
@@ -1129,8 +1179,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            limit_offset=Decimal("5"),
-            trailing_offset=Decimal("10"),
+            limit_offset=DECIMAL_5,
+            trailing_offset=DECIMAL_10,
         )
 
         # Assert
@@ -1157,10 +1207,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            price=Price.from_str("1.00000"),
-            trigger_price=Price.from_str("1.10010"),
-            limit_offset=Decimal("5"),
-            trailing_offset=Decimal("10"),
+            price=PRICE_1_00000,
+            trigger_price=PRICE_1_10010,
+            limit_offset=DECIMAL_5,
+            trailing_offset=DECIMAL_10,
             trigger_type=TriggerType.MARK_PRICE,
             trailing_offset_type=TrailingOffsetType.BASIS_POINTS,
         )
@@ -1216,8 +1266,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            limit_offset=Decimal("5"),
-            trailing_offset=Decimal("10"),
+            limit_offset=DECIMAL_5,
+            trailing_offset=DECIMAL_10,
             trigger_type=TriggerType.MARK_PRICE,
             trailing_offset_type=TrailingOffsetType.BASIS_POINTS,
         )
@@ -1273,15 +1323,15 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("1.00000"),
-            tp_price=Price.from_str("1.00010"),
+            sl_trigger_price=PRICE_1_00000,
+            tp_price=PRICE_1_00010,
         )
         bracket2 = self.order_factory.bracket(
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("1.00000"),
-            tp_price=Price.from_str("1.00010"),
+            sl_trigger_price=PRICE_1_00000,
+            tp_price=PRICE_1_00010,
         )
 
         # Act, Assert
@@ -1294,8 +1344,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("0.99990"),
-            tp_price=Price.from_str("1.00010"),
+            sl_trigger_price=PRICE_0_99990,
+            tp_price=PRICE_1_00010,
         )
 
         # Assert
@@ -1303,30 +1353,42 @@ class TestOrders:
         assert bracket.instrument_id == AUDUSD_SIM.id
         assert len(bracket) == 3
         assert len(bracket.orders) == 3
-        assert bracket.orders[0].order_type == OrderType.MARKET
-        assert bracket.orders[1].order_type == OrderType.STOP_MARKET
-        assert bracket.orders[2].order_type == OrderType.LIMIT
-        assert bracket.orders[0].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[1].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[2].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[0].client_order_id == ClientOrderId("O-19700101-0000-000-001-1")
-        assert bracket.orders[1].client_order_id == ClientOrderId("O-19700101-0000-000-001-2")
-        assert bracket.orders[2].client_order_id == ClientOrderId("O-19700101-0000-000-001-3")
-        assert bracket.orders[0].side == OrderSide.BUY
-        assert bracket.orders[1].side == OrderSide.SELL
-        assert bracket.orders[2].side == OrderSide.SELL
-        assert bracket.orders[0].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[2].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].trigger_price == Price.from_str("0.99990")
-        assert bracket.orders[2].price == Price.from_str("1.00010")
+        assert [order.order_type for order in bracket.orders] == [
+            OrderType.MARKET,
+            OrderType.STOP_MARKET,
+            OrderType.LIMIT,
+        ]
+        assert [order.instrument_id for order in bracket.orders] == [
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+        ]
+        assert [order.client_order_id for order in bracket.orders] == [
+            ClientOrderId("O-19700101-0000-000-001-1"),
+            ClientOrderId("O-19700101-0000-000-001-2"),
+            ClientOrderId("O-19700101-0000-000-001-3"),
+        ]
+        assert [order.side for order in bracket.orders] == [
+            OrderSide.BUY,
+            OrderSide.SELL,
+            OrderSide.SELL,
+        ]
+        assert [order.quantity for order in bracket.orders] == [
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+        ]
+        assert bracket.orders[1].trigger_price == PRICE_0_99990
+        assert bracket.orders[2].price == PRICE_1_00010
         assert bracket.orders[1].time_in_force == TimeInForce.GTC
         assert bracket.orders[2].time_in_force == TimeInForce.GTC
         assert bracket.orders[1].expire_time is None
         assert bracket.orders[2].expire_time is None
-        assert bracket.orders[0].contingency_type == ContingencyType.OTO
-        assert bracket.orders[1].contingency_type == ContingencyType.OUO
-        assert bracket.orders[2].contingency_type == ContingencyType.OUO
+        assert [order.contingency_type for order in bracket.orders] == [
+            ContingencyType.OTO,
+            ContingencyType.OUO,
+            ContingencyType.OUO,
+        ]
         assert bracket.orders[0].linked_order_ids == [
             ClientOrderId("O-19700101-0000-000-001-2"),
             ClientOrderId("O-19700101-0000-000-001-3"),
@@ -1343,10 +1405,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            entry_price=Price.from_str("1.00000"),
-            sl_trigger_price=Price.from_str("0.99990"),
-            tp_price=Price.from_str("1.00010"),
-            tp_trigger_price=Price.from_str("1.00010"),
+            entry_price=PRICE_1_00000,
+            sl_trigger_price=PRICE_0_99990,
+            tp_price=PRICE_1_00010,
+            tp_trigger_price=PRICE_1_00010,
             time_in_force=TimeInForce.GTC,
             entry_order_type=OrderType.LIMIT,
             tp_order_type=OrderType.LIMIT_IF_TOUCHED,
@@ -1358,33 +1420,43 @@ class TestOrders:
         assert bracket.instrument_id == AUDUSD_SIM.id
         assert len(bracket) == 3
         assert len(bracket.orders) == 3
-        assert bracket.orders[0].order_type == OrderType.LIMIT
-        assert bracket.orders[1].order_type == OrderType.STOP_MARKET
-        assert bracket.orders[2].order_type == OrderType.LIMIT_IF_TOUCHED
-        assert bracket.orders[0].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[1].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[2].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[0].client_order_id == ClientOrderId("O-19700101-0000-000-001-1")
-        assert bracket.orders[1].client_order_id == ClientOrderId("O-19700101-0000-000-001-2")
-        assert bracket.orders[2].client_order_id == ClientOrderId("O-19700101-0000-000-001-3")
-        assert bracket.orders[0].side == OrderSide.BUY
-        assert bracket.orders[1].side == OrderSide.SELL
-        assert bracket.orders[2].side == OrderSide.SELL
-        assert bracket.orders[0].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[2].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].trigger_price == Price.from_str("0.99990")
-        assert bracket.orders[2].price == Price.from_str("1.00010")
+        assert [order.order_type for order in bracket.orders] == [
+            OrderType.LIMIT,
+            OrderType.STOP_MARKET,
+            OrderType.LIMIT_IF_TOUCHED,
+        ]
+        assert [order.instrument_id for order in bracket.orders] == [
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+        ]
+        assert [order.client_order_id for order in bracket.orders] == [
+            ClientOrderId("O-19700101-0000-000-001-1"),
+            ClientOrderId("O-19700101-0000-000-001-2"),
+            ClientOrderId("O-19700101-0000-000-001-3"),
+        ]
+        assert [order.side for order in bracket.orders] == [
+            OrderSide.BUY,
+            OrderSide.SELL,
+            OrderSide.SELL,
+        ]
+        assert [order.quantity for order in bracket.orders] == [
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+        ]
+        assert bracket.orders[1].trigger_price == PRICE_0_99990
+        assert bracket.orders[2].price == PRICE_1_00010
         assert bracket.orders[1].time_in_force == TimeInForce.GTC
         assert bracket.orders[2].time_in_force == TimeInForce.GTC
         assert bracket.orders[1].expire_time is None
         assert bracket.orders[2].expire_time is None
-        assert bracket.orders[0].is_post_only is False
-        assert bracket.orders[1].is_post_only is False
-        assert bracket.orders[2].is_post_only is False
-        assert bracket.orders[0].contingency_type == ContingencyType.OTO
-        assert bracket.orders[1].contingency_type == ContingencyType.OUO
-        assert bracket.orders[2].contingency_type == ContingencyType.OUO
+        assert [order.is_post_only for order in bracket.orders] == [False, False, False]
+        assert [order.contingency_type for order in bracket.orders] == [
+            ContingencyType.OTO,
+            ContingencyType.OUO,
+            ContingencyType.OUO,
+        ]
         assert bracket.orders[0].linked_order_ids == [
             ClientOrderId("O-19700101-0000-000-001-2"),
             ClientOrderId("O-19700101-0000-000-001-3"),
@@ -1401,11 +1473,11 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            entry_trigger_price=Price.from_str("1.00000"),
-            entry_price=Price.from_str("1.00000"),
-            sl_trigger_price=Price.from_str("0.99990"),
-            tp_trigger_price=Price.from_str("1.00010"),
-            tp_price=Price.from_str("1.00010"),
+            entry_trigger_price=PRICE_1_00000,
+            entry_price=PRICE_1_00000,
+            sl_trigger_price=PRICE_0_99990,
+            tp_trigger_price=PRICE_1_00010,
+            tp_price=PRICE_1_00010,
             time_in_force=TimeInForce.GTC,
             entry_order_type=OrderType.LIMIT_IF_TOUCHED,
             tp_order_type=OrderType.LIMIT_IF_TOUCHED,
@@ -1416,30 +1488,42 @@ class TestOrders:
         assert bracket.instrument_id == AUDUSD_SIM.id
         assert len(bracket) == 3
         assert len(bracket.orders) == 3
-        assert bracket.orders[0].order_type == OrderType.LIMIT_IF_TOUCHED
-        assert bracket.orders[1].order_type == OrderType.STOP_MARKET
-        assert bracket.orders[2].order_type == OrderType.LIMIT_IF_TOUCHED
-        assert bracket.orders[0].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[1].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[2].instrument_id == AUDUSD_SIM.id
-        assert bracket.orders[0].client_order_id == ClientOrderId("O-19700101-0000-000-001-1")
-        assert bracket.orders[1].client_order_id == ClientOrderId("O-19700101-0000-000-001-2")
-        assert bracket.orders[2].client_order_id == ClientOrderId("O-19700101-0000-000-001-3")
-        assert bracket.orders[0].side == OrderSide.BUY
-        assert bracket.orders[1].side == OrderSide.SELL
-        assert bracket.orders[2].side == OrderSide.SELL
-        assert bracket.orders[0].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[2].quantity == Quantity.from_int(100_000)
-        assert bracket.orders[1].trigger_price == Price.from_str("0.99990")
-        assert bracket.orders[2].price == Price.from_str("1.00010")
+        assert [order.order_type for order in bracket.orders] == [
+            OrderType.LIMIT_IF_TOUCHED,
+            OrderType.STOP_MARKET,
+            OrderType.LIMIT_IF_TOUCHED,
+        ]
+        assert [order.instrument_id for order in bracket.orders] == [
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+            AUDUSD_SIM.id,
+        ]
+        assert [order.client_order_id for order in bracket.orders] == [
+            ClientOrderId("O-19700101-0000-000-001-1"),
+            ClientOrderId("O-19700101-0000-000-001-2"),
+            ClientOrderId("O-19700101-0000-000-001-3"),
+        ]
+        assert [order.side for order in bracket.orders] == [
+            OrderSide.BUY,
+            OrderSide.SELL,
+            OrderSide.SELL,
+        ]
+        assert [order.quantity for order in bracket.orders] == [
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+            Quantity.from_int(100_000),
+        ]
+        assert bracket.orders[1].trigger_price == PRICE_0_99990
+        assert bracket.orders[2].price == PRICE_1_00010
         assert bracket.orders[1].time_in_force == TimeInForce.GTC
         assert bracket.orders[2].time_in_force == TimeInForce.GTC
         assert bracket.orders[1].expire_time is None
         assert bracket.orders[2].expire_time is None
-        assert bracket.orders[0].contingency_type == ContingencyType.OTO
-        assert bracket.orders[1].contingency_type == ContingencyType.OUO
-        assert bracket.orders[2].contingency_type == ContingencyType.OUO
+        assert [order.contingency_type for order in bracket.orders] == [
+            ContingencyType.OTO,
+            ContingencyType.OUO,
+            ContingencyType.OUO,
+        ]
         assert bracket.orders[0].linked_order_ids == [
             ClientOrderId("O-19700101-0000-000-001-2"),
             ClientOrderId("O-19700101-0000-000-001-3"),
@@ -1456,8 +1540,8 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("0.99990"),
-            tp_price=Price.from_str("1.00010"),
+            sl_trigger_price=PRICE_0_99990,
+            tp_price=PRICE_1_00010,
         )
 
         # Assert
@@ -1468,116 +1552,152 @@ class TestOrders:
             "OrderList(id=OL-19700101-0000-000-001-1, instrument_id=AUD/USD.SIM, strategy_id=S-001, orders=[MarketOrder(BUY 100_000 AUD/USD.SIM MARKET GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=None, contingency_type=OTO, linked_order_ids=[O-19700101-0000-000-001-2, O-19700101-0000-000-001-3], tags=ENTRY), StopMarketOrder(SELL 100_000 AUD/USD.SIM STOP_MARKET @ 0.99990[DEFAULT] GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-2, venue_order_id=None, contingency_type=OUO, linked_order_ids=[O-19700101-0000-000-001-3], parent_order_id=O-19700101-0000-000-001-1, tags=STOP_LOSS), LimitOrder(SELL 100_000 AUD/USD.SIM LIMIT @ 1.00010 GTC, status=INITIALIZED, client_order_id=O-19700101-0000-000-001-3, venue_order_id=None, contingency_type=OUO, linked_order_ids=[O-19700101-0000-000-001-2], parent_order_id=O-19700101-0000-000-001-1, tags=TAKE_PROFIT)])"  # noqa
         )
 
-    def test_apply_order_denied_event(self):
+    def test_apply_order_denied_event(self, market_order):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
         denied = OrderDenied(
             self.trader_id,
             self.strategy_id,
             AUDUSD_SIM.id,
-            order.client_order_id,
+            market_order.client_order_id,
             "SOME_REASON",
-            UUID4(),
+            TEST_UUID,
             0,
         )
 
         # Act
-        order.apply(denied)
+        market_order.apply(denied)
 
         # Assert
-        assert order.status == OrderStatus.DENIED
-        assert order.event_count == 2
-        assert order.last_event == denied
-        assert not order.is_open
-        assert order.is_closed
-
-    def test_apply_order_submitted_event(self):
-        # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        submitted = TestEventStubs.order_submitted(order)
+        assert market_order.status == OrderStatus.DENIED
+        assert market_order.event_count == 2
+        assert market_order.last_event == denied
+        assert not market_order.is_open
+        assert market_order.is_closed
 
+    @pytest.mark.parametrize(
+        "event_stubs, status, is_inflight, is_open, is_closed, pending_update, pending_cancel",
+        [
+            [
+                [TestEventStubs.order_submitted],
+                OrderStatus.SUBMITTED,
+                True,
+                False,
+                False,
+                False,
+                False,
+            ],
+            [
+                [TestEventStubs.order_submitted, TestEventStubs.order_rejected],
+                OrderStatus.REJECTED,
+                False,
+                False,
+                True,
+                False,
+                False,
+            ],
+            [
+                [
+                    TestEventStubs.order_submitted,
+                    TestEventStubs.order_accepted,
+                    TestEventStubs.order_pending_cancel,
+                ],
+                OrderStatus.PENDING_CANCEL,
+                True,
+                True,
+                False,
+                False,
+                True,
+            ],
+            [
+                [
+                    TestEventStubs.order_submitted,
+                    TestEventStubs.order_accepted,
+                    TestEventStubs.order_pending_cancel,
+                    TestEventStubs.order_canceled,
+                ],
+                OrderStatus.CANCELED,
+                False,
+                False,
+                True,
+                False,
+                False,
+            ],
+            [
+                [
+                    TestEventStubs.order_submitted,
+                    TestEventStubs.order_accepted,
+                    TestEventStubs.order_pending_update,
+                ],
+                OrderStatus.PENDING_UPDATE,
+                True,
+                True,
+                False,
+                True,
+                False,
+            ],
+        ],
+        ids=["submitted", "rejected", "pending_cancel", "canceled", "pending_update"],
+    )
+    def test_apply_order_events_to_market_order(
+        self,
+        event_stubs,
+        status,
+        is_inflight,
+        is_open,
+        is_closed,
+        pending_update,
+        pending_cancel,
+        market_order,
+    ):
         # Act
-        order.apply(submitted)
+        for event_stub in event_stubs:
+            event = event_stub(market_order)
+            market_order.apply(event)
 
         # Assert
-        assert order.status == OrderStatus.SUBMITTED
-        assert order.event_count == 2
-        assert order.last_event == submitted
-        assert order.is_inflight
-        assert not order.is_open
-        assert not order.is_closed
-        assert not order.is_pending_update
-        assert not order.is_pending_cancel
-
-    def test_apply_order_accepted_event(self):
+        assert market_order.status == status
+        assert market_order.event_count == len(event_stubs) + 1
+        assert market_order.last_event == event
+        assert market_order.is_inflight == is_inflight
+        assert market_order.is_open == is_open
+        assert market_order.is_closed == is_closed
+        assert market_order.is_canceled == (status == OrderStatus.CANCELED)
+        assert market_order.is_pending_update == pending_update
+        assert market_order.is_pending_cancel == pending_cancel
+
+    def test_apply_order_accepted_event(self, market_order):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
+        market_order.apply(TestEventStubs.order_submitted(market_order))
 
         # Act
-        order.apply(TestEventStubs.order_accepted(order))
+        market_order.apply(TestEventStubs.order_accepted(market_order))
 
         # Assert
-        assert order.status == OrderStatus.ACCEPTED
-        assert not order.is_inflight
-        assert order.is_open
-        assert not order.is_closed
+        assert market_order.status == OrderStatus.ACCEPTED
+        assert not market_order.is_inflight
+        assert market_order.is_open
+        assert not market_order.is_closed
         assert (
-            str(order)
+            str(market_order)
             == "MarketOrder(BUY 100_000 AUD/USD.SIM MARKET GTC, status=ACCEPTED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=1, tags=None)"  # noqa
         )
         assert (
-            repr(order)
+            repr(market_order)
             == "MarketOrder(BUY 100_000 AUD/USD.SIM MARKET GTC, status=ACCEPTED, client_order_id=O-19700101-0000-000-001-1, venue_order_id=1, tags=None)"  # noqa
         )
 
-    def test_apply_order_rejected_event(self):
-        # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-
-        # Act
-        order.apply(TestEventStubs.order_rejected(order))
-
-        # Assert
-        assert order.status == OrderStatus.REJECTED
-        assert not order.is_inflight
-        assert not order.is_open
-        assert order.is_closed
-
     def test_apply_order_expired_event(self):
         # Arrange
         order = self.order_factory.stop_market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("0.99990"),
+            PRICE_0_99990,
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
 
         # Act
         order.apply(TestEventStubs.order_expired(order))
@@ -1594,14 +1714,13 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
-            Price.from_str("0.99990"),
+            PRICE_1_00000,
+            PRICE_0_99990,
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
 
         # Act
         order.apply(TestEventStubs.order_triggered(order))
@@ -1612,88 +1731,16 @@ class TestOrders:
         assert order.is_open
         assert not order.is_closed
 
-    def test_order_status_pending_cancel(self):
-        # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
-
-        # Act
-        order.apply(TestEventStubs.order_pending_cancel(order))
-
-        # Assert
-        assert order.status == OrderStatus.PENDING_CANCEL
-        assert order.is_inflight
-        assert order.is_open
-        assert not order.is_closed
-        assert not order.is_pending_update
-        assert order.is_pending_cancel
-        assert order.event_count == 4
-
-    def test_apply_order_canceled_event(self):
-        # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
-        order.apply(TestEventStubs.order_pending_cancel(order))
-
-        # Act
-        order.apply(TestEventStubs.order_canceled(order))
-
-        # Assert
-        assert order.status == OrderStatus.CANCELED
-        assert order.is_canceled
-        assert not order.is_inflight
-        assert not order.is_open
-        assert order.is_closed
-        assert not order.is_pending_update
-        assert not order.is_pending_cancel
-        assert order.event_count == 5
-
-    def test_order_status_pending_update(self):
-        # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
-
-        # Act
-        order.apply(TestEventStubs.order_pending_update(order))
-
-        # Assert
-        assert order.status == OrderStatus.PENDING_UPDATE
-        assert order.is_inflight
-        assert order.is_open
-        assert not order.is_closed
-        assert order.is_pending_update
-        assert not order.is_pending_cancel
-        assert order.event_count == 4
-
     def test_apply_order_updated_event_to_stop_market_order(self):
         # Arrange
         order = self.order_factory.stop_market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
         order.apply(TestEventStubs.order_pending_update(order))
 
         updated = OrderUpdated(
@@ -1701,12 +1748,12 @@ class TestOrders:
             order.strategy_id,
             order.instrument_id,
             order.client_order_id,
-            VenueOrderId("1"),
+            VENUE_ORDER_ID,
             order.account_id,
             Quantity.from_int(120000),
             None,
-            Price.from_str("1.00001"),
-            UUID4(),
+            PRICE_1_00001,
+            TEST_UUID,
             0,
             0,
         )
@@ -1716,9 +1763,9 @@ class TestOrders:
 
         # Assert
         assert order.status == OrderStatus.ACCEPTED
-        assert order.venue_order_id == VenueOrderId("1")
+        assert order.venue_order_id == VENUE_ORDER_ID
         assert order.quantity == Quantity.from_int(120_000)
-        assert order.trigger_price == Price.from_str("1.00001")
+        assert order.trigger_price == PRICE_1_00001
         assert not order.is_inflight
         assert order.is_open
         assert not order.is_closed
@@ -1730,11 +1777,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
         order.apply(
             TestEventStubs.order_filled(
                 order,
@@ -1749,12 +1795,12 @@ class TestOrders:
             order.strategy_id,
             order.instrument_id,
             order.client_order_id,
-            VenueOrderId("1"),
+            VENUE_ORDER_ID,
             order.account_id,
             Quantity.from_int(120_000),
             None,
-            Price.from_str("1.00001"),
-            UUID4(),
+            PRICE_1_00001,
+            TEST_UUID,
             0,
             0,
         )
@@ -1764,7 +1810,7 @@ class TestOrders:
 
         # Assert
         assert order.status == OrderStatus.PARTIALLY_FILLED
-        assert order.venue_order_id == VenueOrderId("1")
+        assert order.venue_order_id == VENUE_ORDER_ID
         assert order.quantity == Quantity.from_int(120_000)
         assert order.filled_qty == Quantity.from_int(50_000)
         assert order.leaves_qty == Quantity.from_int(70_000)
@@ -1779,11 +1825,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.SELL,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
         order.apply(
             TestEventStubs.order_filled(
                 order,
@@ -1798,12 +1843,12 @@ class TestOrders:
             order.strategy_id,
             order.instrument_id,
             order.client_order_id,
-            VenueOrderId("1"),
+            VENUE_ORDER_ID,
             order.account_id,
             Quantity.from_int(120_000),
             None,
-            Price.from_str("1.00001"),
-            UUID4(),
+            PRICE_1_00001,
+            TEST_UUID,
             0,
             0,
         )
@@ -1813,7 +1858,7 @@ class TestOrders:
 
         # Assert
         assert order.status == OrderStatus.PARTIALLY_FILLED
-        assert order.venue_order_id == VenueOrderId("1")
+        assert order.venue_order_id == VENUE_ORDER_ID
         assert order.quantity == Quantity.from_int(120_000)
         assert order.filled_qty == Quantity.from_int(50_000)
         assert order.leaves_qty == Quantity.from_int(70_000)
@@ -1829,11 +1874,10 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
         order.apply(TestEventStubs.order_pending_update(order))
 
         updated = OrderUpdated(
@@ -1844,9 +1888,9 @@ class TestOrders:
             VenueOrderId("2"),
             order.account_id,
             Quantity.from_int(120_000),
-            Price.from_str("1.00001"),
+            PRICE_1_00001,
             None,
-            UUID4(),
+            TEST_UUID,
             0,
             0,
         )
@@ -1856,179 +1900,152 @@ class TestOrders:
 
         # Assert
         assert order.venue_order_id == VenueOrderId("2")
-        assert order.venue_order_ids == [VenueOrderId("1")]
+        assert order.venue_order_ids == [VENUE_ORDER_ID]
 
-    def test_apply_order_filled_event_to_order_without_accepted(self):
+    def test_apply_order_filled_event_to_order_without_accepted(self, market_order):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(market_order)
 
         filled = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("1.00001"),
+            last_px=PRICE_1_00001,
         )
 
         # Act
-        order.apply(filled)
+        market_order.apply(filled)
 
         # Assert
-        assert order.status == OrderStatus.FILLED
-        assert order.filled_qty == Quantity.from_int(100_000)
-        assert order.leaves_qty == Quantity.zero()
-        assert order.signed_decimal_qty() == Decimal()
-        assert order.avg_px == 1.00001
-        assert len(order.trade_ids) == 1
-        assert not order.is_inflight
-        assert not order.is_open
-        assert order.is_closed
-        assert order.ts_last == 0
-
-    def test_apply_order_filled_event_to_market_order(self):
+        assert market_order.status == OrderStatus.FILLED
+        assert market_order.filled_qty == Quantity.from_int(100_000)
+        assert market_order.leaves_qty == Quantity.zero()
+        assert market_order.signed_decimal_qty() == Decimal()
+        assert market_order.avg_px == 1.00001
+        assert len(market_order.trade_ids) == 1
+        assert not market_order.is_inflight
+        assert not market_order.is_open
+        assert market_order.is_closed
+        assert market_order.ts_last == 0
+
+    def test_apply_order_filled_event_to_market_order(self, market_order):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(market_order)
 
         filled = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("1.00001"),
+            last_px=PRICE_1_00001,
         )
 
         # Act
-        order.apply(filled)
+        market_order.apply(filled)
 
         # Assert
-        assert order.status == OrderStatus.FILLED
-        assert order.filled_qty == Quantity.from_int(100_000)
-        assert order.signed_decimal_qty() == Decimal()
-        assert order.avg_px == 1.00001
-        assert len(order.trade_ids) == 1
-        assert not order.is_inflight
-        assert not order.is_open
-        assert order.is_closed
-        assert order.ts_last == 0
+        assert market_order.status == OrderStatus.FILLED
+        assert market_order.filled_qty == Quantity.from_int(100_000)
+        assert market_order.signed_decimal_qty() == Decimal()
+        assert market_order.avg_px == 1.00001
+        assert len(market_order.trade_ids) == 1
+        assert not market_order.is_inflight
+        assert not market_order.is_open
+        assert market_order.is_closed
+        assert market_order.ts_last == 0
 
     def test_apply_partial_fill_events_to_market_order_results_in_partially_filled(
         self,
+        market_order,
     ):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(market_order)
 
         fill1 = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
             trade_id=TradeId("1"),
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("1.00001"),
+            last_px=PRICE_1_00001,
             last_qty=Quantity.from_int(20_000),
         )
 
         fill2 = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
             trade_id=TradeId("2"),
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
             last_px=Price.from_str("1.00002"),
             last_qty=Quantity.from_int(40_000),
         )
 
         # Act
-        order.apply(fill1)
-        order.apply(fill2)
+        market_order.apply(fill1)
+        market_order.apply(fill2)
 
         # Assert
-        assert order.status == OrderStatus.PARTIALLY_FILLED
-        assert order.filled_qty == Quantity.from_int(60_000)
-        assert order.leaves_qty == Quantity.from_int(40_000)
-        assert order.signed_decimal_qty() == Decimal(40_000)
-        assert order.avg_px == 1.000014
-        assert len(order.trade_ids) == 2
-        assert not order.is_inflight
-        assert order.is_open
-        assert not order.is_closed
-        assert order.ts_last == 0
-
-    def test_apply_filled_events_to_market_order_results_in_filled(self):
+        assert market_order.status == OrderStatus.PARTIALLY_FILLED
+        assert market_order.filled_qty == Quantity.from_int(60_000)
+        assert market_order.leaves_qty == Quantity.from_int(40_000)
+        assert market_order.signed_decimal_qty() == Decimal(40_000)
+        assert market_order.avg_px == 1.000014
+        assert len(market_order.trade_ids) == 2
+        assert not market_order.is_inflight
+        assert market_order.is_open
+        assert not market_order.is_closed
+        assert market_order.ts_last == 0
+
+    def test_apply_filled_events_to_market_order_results_in_filled(self, market_order):
         # Arrange
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100_000),
-        )
-
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(market_order)
 
         fill1 = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
             trade_id=TradeId("1"),
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("1.00001"),
+            last_px=PRICE_1_00001,
             last_qty=Quantity.from_int(20_000),
         )
 
         fill2 = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
             trade_id=TradeId("2"),
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
             last_px=Price.from_str("1.00002"),
             last_qty=Quantity.from_int(40_000),
         )
 
         fill3 = TestEventStubs.order_filled(
-            order,
+            market_order,
             instrument=AUDUSD_SIM,
             trade_id=TradeId("3"),
-            position_id=PositionId("P-123456"),
+            position_id=POSITION_ID,
             strategy_id=StrategyId("S-001"),
             last_px=Price.from_str("1.00003"),
             last_qty=Quantity.from_int(40_000),
         )
 
         # Act
-        order.apply(fill1)
-        order.apply(fill2)
-        order.apply(fill3)
+        market_order.apply(fill1)
+        market_order.apply(fill2)
+        market_order.apply(fill3)
 
         # Assert
-        assert order.status == OrderStatus.FILLED
-        assert order.filled_qty == Quantity.from_int(100_000)
-        assert order.avg_px == pytest.approx(1.0000185714285712, rel=1e-9)
-        assert len(order.trade_ids) == 3
-        assert not order.is_inflight
-        assert not order.is_open
-        assert order.is_closed
-        assert order.ts_last == 0
+        assert market_order.status == OrderStatus.FILLED
+        assert market_order.filled_qty == Quantity.from_int(100_000)
+        assert market_order.avg_px == pytest.approx(1.0000185714285712, rel=1e-9)
+        assert len(market_order.trade_ids) == 3
+        assert not market_order.is_inflight
+        assert not market_order.is_open
+        assert market_order.is_closed
+        assert market_order.ts_last == 0
 
     def test_apply_order_filled_event_to_buy_limit_order(self):
         # Arrange
@@ -2036,29 +2053,28 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
 
         filled = OrderFilled(
             order.trader_id,
             order.strategy_id,
             order.instrument_id,
             order.client_order_id,
-            VenueOrderId("1"),
+            VENUE_ORDER_ID,
             order.account_id,
             TradeId("E-1"),
             PositionId("P-1"),
             order.side,
             order.order_type,
             order.quantity,
-            Price.from_str("1.00001"),
+            PRICE_1_00001,
             AUDUSD_SIM.quote_currency,
             Money(0, USD),
             LiquiditySide.MAKER,
-            UUID4(),
+            TEST_UUID,
             0,
             0,
         )
@@ -2069,7 +2085,7 @@ class TestOrders:
         # Assert
         assert order.status == OrderStatus.FILLED
         assert order.filled_qty == Quantity.from_int(100_000)
-        assert order.price == Price.from_str("1.00000")
+        assert order.price == PRICE_1_00000
         assert order.avg_px == 1.00001
         assert order.slippage == 1.0000000000065512e-05
         assert not order.is_inflight
@@ -2083,18 +2099,17 @@ class TestOrders:
             AUDUSD_SIM.id,
             OrderSide.BUY,
             Quantity.from_int(100_000),
-            Price.from_str("1.00000"),
+            PRICE_1_00000,
         )
 
-        order.apply(TestEventStubs.order_submitted(order))
-        order.apply(TestEventStubs.order_accepted(order))
+        TestExecStubs.make_accepted_order(order)
 
         partially = OrderFilled(
             order.trader_id,
             order.strategy_id,
             order.instrument_id,
             order.client_order_id,
-            VenueOrderId("1"),
+            VENUE_ORDER_ID,
             order.account_id,
             TradeId("E-1"),
             PositionId("P-1"),
@@ -2105,7 +2120,7 @@ class TestOrders:
             AUDUSD_SIM.quote_currency,
             Money(0, USD),
             LiquiditySide.MAKER,
-            UUID4(),
+            TEST_UUID,
             1_000_000_000,
             1_000_000_000,
         )
@@ -2116,7 +2131,7 @@ class TestOrders:
         # Assert
         assert order.status == OrderStatus.PARTIALLY_FILLED
         assert order.filled_qty == Quantity.from_int(50_000)
-        assert order.price == Price.from_str("1.00000")
+        assert order.price == PRICE_1_00000
         assert order.avg_px == 0.999999
         assert order.slippage == -1.0000000000287557e-06
         assert not order.is_inflight
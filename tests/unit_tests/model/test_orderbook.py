@@ -210,7 +210,6 @@ class TestOrderBook:
 
     def test_pprint_full_book(self):
         result = self.sample_book.pprint()
-        print(result)
         expected = """bids     price   asks
 ------  -------  ------
         0.90000  [20.0]
@@ -29,7 +29,6 @@ def test_order_id():
     assert order.order_id == "1"
 
     order = BookOrder(price=100.0, size=10.0, side=OrderSide.BUY)
-    print(order.order_id)
     assert len(order.order_id) == 36
 
 